@@ -0,0 +1,13 @@
+from django.db import models
+
+# The SQL for Null never changes, so share a single immutable result
+NULL_SQL = ("NULL", ())
+
+
+class Null(models.Expression):
+    """
+    An expression that always returns None.
+    """
+
+    def as_sql(self, compiler, connection):
+        return NULL_SQL
@@ -0,0 +1,170 @@
+from django.db import models
+from django.utils.functional import cached_property
+
+from .expressions import Null
+from .utils import log_or_raise
+
+GET_INSTANCE_MESSAGE = 'Accessed deprecated field "%s" on instance of "%s.%s"'
+GET_CLASS_MESSAGE = 'Accessed deprecated field "%s" on model class "%s.%s"'
+SET_INSTANCE_MESSAGE = 'Tried to set deprecated field "%s" on instance of "%s.%s"'
+QUERY_MESSAGE = 'Deprecated field "%s" on "%s.%s" referenced in query'
+WRITE_MESSAGE = 'Writing to deprecated field "%s" on "%s.%s"'
+
+DEFERRED = models.DEFERRED  # type: ignore
+
+
+class DeprecatedFieldDescriptor:
+    """
+    A descriptor for a deprecated field. Logs an error whenever it's accessed
+    and always returns None.
+    """
+
+    __slots__ = (
+        "field",
+        "model",
+        "get_instance_message",
+        "get_class_message",
+        "set_instance_message",
+    )
+
+    def __init__(self, field):
+        self.field = field
+
+        # The descriptor is created once the field has been added to the
+        # model, so the messages for that model can be formatted up front.
+        self.model = model = field.model
+        self.get_instance_message = field.format_message(GET_INSTANCE_MESSAGE, model)
+        self.get_class_message = field.format_message(GET_CLASS_MESSAGE, model)
+        self.set_instance_message = field.format_message(SET_INSTANCE_MESSAGE, model)
+
+    def __get__(self, instance, cls=None):
+        if instance:
+            if instance.__class__ is self.model:
+                message = self.get_instance_message
+            else:
+                message = self.field.format_message(
+                    GET_INSTANCE_MESSAGE, instance.__class__
+                )
+            log_or_raise(message)
+        elif cls:
+            if cls is self.model:
+                message = self.get_class_message
+            else:
+                message = self.field.format_message(GET_CLASS_MESSAGE, cls)
+            log_or_raise(message)
+
+    def __set__(self, instance, value) -> None:
+        if instance.__class__ is self.model:
+            message = self.set_instance_message
+        else:
+            message = self.field.format_message(
+                SET_INSTANCE_MESSAGE, instance.__class__
+            )
+        log_or_raise(message)
+
+
+class DeprecatedField(models.Field):
+    """
+    A field that ensures a column can safely be removed from the database in
+    a later deploy.
+
+    This ensures that Django does not reference the field in queries by default,
+    and if the field is explicitly referenced either an exception is raised or
+    an error is raised. The column will still be referenced in the database if
+    used in an .update() query, but in all other queries any reference to the
+    column is replaced with a NULL literal.
+    """
+
+    concrete = False
+    descriptor_class = DeprecatedFieldDescriptor
+
+    def __init__(self, original_field: models.Field) -> None:
+        super().__init__()
+        self.original_field = original_field
+
+    def contribute_to_class(self, cls, name, private_only=False):
+        super().contribute_to_class(cls, name, private_only=private_only)
+
+        # Django sets concrete on the instance based on the column, remove it
+        # so the class attribute is used instead.
+        del self.concrete
+
+        # The messages only depend on the field name and the model, so format
+        # them once here instead of on every query.
+        self.query_message = self.format_message(QUERY_MESSAGE, cls)
+        self.write_message = self.format_message(WRITE_MESSAGE, cls)
+
+    def format_message(self, message_format: str, model) -> str:
+        """
+        Format one of the log messages for this field on the given model.
+        """
+
+        return message_format % (self.name, model.__module__, model.__qualname__)
+
+    def clone(self):
+        """
+        This is where the magic happens. Instead of returning a copy of this
+        field we return a copy of the underlying field. This method is called
+        when the Django migrations system checks for changes, meaning that this
+        ensures the deprecation is invisible to the migration system.
+        """
+
+        return self.original_field.clone()
+
+    def deconstruct(self):
+        """
+        Deconstruct as the underlying field, for the same reason as clone().
+        The field itself can't be reconstructed from its own arguments, as it
+        always needs the original field.
+        """
+
+        _, path, args, kwargs = self.original_field.deconstruct()
+        return self.name, path, args, kwargs
+
+    def get_col(self, alias, output_field=None):
+        """
+        Hook in to detect when the column is used in a query and replace the
+        column reference with null literal in the query.
+
+        Even though the field is marked as concrete=False, Django still allows
+        it to be referenced in .values() and .values_list() queries. This will
+        catch these cases and either raise an exception or log an error and
+        set the selected value to "NULL" in the database query.
+        """
+
+        log_or_raise(self.query_message)
+        if output_field is None or output_field is self:
+            return self.cached_null
+        return Null(output_field=output_field)
+
+    @cached_property
+    def cached_null(self):
+        """
+        The NULL literal is the same for every query, so reuse it like Django
+        does for the column reference in Field.cached_col.
+        """
+
+        return Null(output_field=self)
+
+    def get_db_prep_save(self, value, connection):
+        """
+        Hook in to detect when the field is used in an update query.
+
+        Even though the field is marked as concrete=False, Django still allows
+        it to be referenced in .update(foo=bar) queries. This will catch these
+        cases and log or raise an error.
+        """
+
+        log_or_raise(self.write_message)
+        if value is None:
+            return None
+        return self.get_db_prep_value(value, connection=connection, prepared=False)
+
+    def get_default(self):
+        """
+        Hook into the logic Django uses to set a value on a model if one wasn't
+        provided in __init__, create() or similar. This basically tells Django
+        to not set a value, which we don't want for deprecated fields.
+        """
+
+        return DEFERRED
@@ -0,0 +1,213 @@
+import logging
+import random
+import threading
+from typing import Any, Dict, Set
+
+from django.core.signals import request_finished, setting_changed
+from django.dispatch import receiver
+
+# Use the package name rather than __name__, so records keep coming from the
+# same logger as before the code was split into modules.
+logger = logging.getLogger("deprecated_field")
+
+# Cache of settings, to avoid going through Django's lazy settings object
+# every time a deprecated field is accessed.
+_settings_cache: Dict[str, Any] = {}
+
+# When DEPRECATED_FIELD_BATCH_LOGS is enabled identical errors are counted
+# per thread and logged once, either when flush_logs() is called or once the
+# same error has been seen this many times.
+BATCH_LOG_THRESHOLD = 1000
+
+# Per thread state for batching and sampling errors
+_local = threading.local()
+
+
+class DeprecatedFieldAccessError(Exception):
+    """
+    Raised if a deprecated field is accessed in strict mode
+    """
+
+
+def _get_flag(name: str) -> bool:
+    """
+    Look up a boolean setting, caching the value for subsequent calls.
+    """
+
+    try:
+        return _settings_cache[name]
+    except KeyError:
+        # Settings are only needed once a deprecated field is actually
+        # accessed, so avoid importing them when the package is imported.
+        from django.conf import settings  # type: ignore
+
+        value = _settings_cache[name] = getattr(settings, name, None) is True
+        return value
+
+
+def _get_sample_rate() -> float:
+    """
+    Get the fraction of errors to log, from the DEPRECATED_FIELD_SAMPLE_RATE
+    setting. Invalid values are reported once and treated as 1.0, so that no
+    errors are lost. Sampling does not apply to batched errors, which are
+    already logged once per batch.
+    """
+
+    name = "DEPRECATED_FIELD_SAMPLE_RATE"
+    try:
+        return _settings_cache[name]
+    except KeyError:
+        from django.conf import settings  # type: ignore
+
+        rate = getattr(settings, name, 1.0)
+        if (
+            isinstance(rate, bool)
+            or not isinstance(rate, (int, float))
+            or not 0 <= rate <= 1
+        ):
+            logger.warning(
+                "Invalid %s %r, expected a number between 0 and 1", name, rate
+            )
+            rate = 1.0
+
+        _settings_cache[name] = rate
+        return rate
+
+
+@receiver(setting_changed)
+def _reset_settings_cache(*, setting: str, **kwargs) -> None:
+    """
+    Make sure changes made through override_settings() are picked up.
+    """
+
+    _settings_cache.pop(setting, None)
+
+
+def log_or_raise(message_format: str, *args) -> None:
+    """
+    Either log an error message or if in strict mode raise an exception.
+
+    If no arguments are given the message is assumed to be already formatted,
+    which is what the fields do to avoid formatting on every access.
+    """
+
+    if _get_flag("STRICT_DEPRECATED_FIELD"):
+        raise DeprecatedFieldAccessError(
+            message_format % args if args else message_format
+        )
+
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+
+    if _get_flag("DEPRECATED_FIELD_BATCH_LOGS"):
+        message = message_format % args if args else message_format
+        counts = _get_batch_counts()
+        count = counts[message] = counts.get(message, 0) + 1
+        if count >= BATCH_LOG_THRESHOLD:
+            del counts[message]
+            # Unlike flush_logs(), this runs where the field was accessed, so
+            # the stack is meaningful here.
+            stack_info = _get_flag("DEPRECATED_FIELD_STACK_INFO")
+            _log_batched(message, count, stack_info=stack_info)
+        return
+
+    rate = _get_sample_rate()
+    if rate < 1:
+        message = message_format % args if args else message_format
+        if not _is_sampled(message, rate):
+            return
+
+    # Capturing the stack is expensive, so only do it when asked to
+    stack_info = _get_flag("DEPRECATED_FIELD_STACK_INFO")
+    logger.error(message_format, *args, stack_info=stack_info)
+
+
+def _is_sampled(message: str, rate: float) -> bool:
+    """
+    Check whether the current error should be logged when only logging the
+    given fraction of errors. The first time an error is seen in a thread it
+    is always logged, so that every deprecated field in use is reported.
+    """
+
+    if rate <= 0:
+        return False
+
+    try:
+        seen: Set[str] = _local.seen
+    except AttributeError:
+        seen = _local.seen = set()
+
+    if message not in seen:
+        seen.add(message)
+        return True
+
+    return random.random() < rate
+
+
+def _get_batch_counts() -> Dict[str, int]:
+    """
+    Get the pending batched errors for the current thread.
+    """
+
+    try:
+        return _local.counts
+    except AttributeError:
+        counts: Dict[str, int] = {}
+        _local.counts = counts
+        return counts
+
+
+def _log_batched(message: str, count: int, stack_info: bool = False) -> None:
+    """
+    Log a single error for a batch of identical errors. The number of times
+    the error occurred is available as the count attribute on the log record.
+    """
+
+    extra = {"count": count}
+    if count > 1:
+        logger.error(
+            "%s (%d times)", message, count, stack_info=stack_info, extra=extra
+        )
+    else:
+        logger.error(message, stack_info=stack_info, extra=extra)
+
+
+def flush_logs() -> None:
+    """
+    Log all errors batched up in the current thread. This is called at the
+    end of each request, but should also be called at the end of other units
+    of work, like management commands or background tasks, when
+    DEPRECATED_FIELD_BATCH_LOGS is enabled.
+
+    The records logged here never include stack information, even when
+    DEPRECATED_FIELD_STACK_INFO is enabled, as the stack would only point
+    here and not at the code that accessed the field.
+    """
+
+    # This runs after every request, so keep it cheap when nothing is pending
+    counts = getattr(_local, "counts", None)
+    if not counts:
+        return
+
+    _local.counts = {}
+    for message, count in counts.items():
+        _log_batched(message, count)
+
+
+def _reset_local_state() -> None:
+    """
+    Discard any batched errors and forget which errors have been sampled in
+    the current thread, without logging anything.
+    """
+
+    _local.counts = {}
+    _local.seen = set()
+
+
+@receiver(request_finished)
+def _flush_logs_on_request_finished(**kwargs) -> None:
+    """
+    Log any errors batched up while handling a request.
+    """
+
+    flush_logs()
@@ -7,6 +7,8 @@ from django.db.migrations.questioner import NonInteractiveMigrationQuestioner
 from django.db.migrations.state import ProjectState
 from django.db.models import CharField
 
+from ..models import Artist
+
 
 def test_make_migrations_deprecated_field(db, capsys):
 
@@ -59,3 +61,14 @@ def test_state_introspection():
     assert isinstance(operation.field, CharField)
     assert operation.field.null is True
     assert operation.field.max_length == 256
+
+
+def test_deconstruct():
+    field = Artist._meta.get_field("name")
+
+    name, path, args, kwargs = field.deconstruct()
+
+    assert name == "name"
+    assert path == "django.db.models.CharField"
+    assert args == []
+    assert kwargs == {"max_length": 256, "null": True}
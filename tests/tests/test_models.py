@@ -32,3 +32,58 @@ def test_init_with_deprecated_field_not_in_db_strict(db, caplog):
     with pytest.raises(DeprecatedFieldAccessError):
         with override_settings(STRICT_DEPRECATED_FIELD=True):
             Genre(name="test")
+
+
+def test_init_with_deprecated_field_no_stack_info(db, caplog):
+
+    caplog.set_level(logging.ERROR)
+
+    Genre(name="test")
+    assert len(caplog.records) == 1
+    assert caplog.records[0].stack_info is None
+
+
+def test_init_with_deprecated_field_stack_info(db, caplog):
+
+    caplog.set_level(logging.ERROR)
+
+    with override_settings(DEPRECATED_FIELD_STACK_INFO=True):
+        Genre(name="test")
+
+    assert len(caplog.records) == 1
+    assert caplog.records[0].stack_info is not None
+
+
+def test_init_with_deprecated_field_logging_disabled(db, caplog):
+
+    caplog.set_level(logging.CRITICAL, logger="deprecated_field")
+
+    Genre(name="test")
+    assert not caplog.records
+
+
+def test_access_deprecated_field_on_class(db, caplog):
+
+    caplog.set_level(logging.ERROR)
+
+    assert Genre.name is None
+    assert (
+        'Accessed deprecated field "name" on model class "tests.models.Genre"'
+        in caplog.text
+    )
+
+
+def test_deprecated_field_not_concrete():
+
+    field = Genre._meta.get_field("name")
+
+    assert field not in Genre._meta.concrete_fields
+    assert field not in Genre._meta.local_concrete_fields
+
+
+def test_deprecated_field_logger_name(db, caplog):
+
+    caplog.set_level(logging.ERROR)
+
+    Genre(name="test")
+    assert caplog.records[0].name == "deprecated_field"
@@ -5,7 +5,7 @@ from django.test import override_settings
 
 from deprecated_field import DeprecatedFieldAccessError
 
-from ..models import Genre
+from ..models import Album, Genre
 
 
 def test_create_without_deprecated_field_not_in_db(db, caplog):
@@ -59,3 +59,43 @@ def test_bulk_create_with_deprecated_field_not_in_db(db, caplog):
 
     Genre.objects.bulk_create(genre)
     assert not caplog.records
+
+
+def test_values_with_deprecated_field_not_in_db(db, caplog):
+    """
+    Ensure that referencing a deprecated field in a query selects NULL
+    instead of the column, which might not exist in the database.
+    """
+
+    Genre.objects.create()
+    caplog.set_level(logging.ERROR)
+
+    assert list(Genre.objects.values_list("name", flat=True)) == [None]
+    assert list(Genre.objects.values("name")) == [{"name": None}]
+    assert (
+        'Deprecated field "name" on "tests.models.Genre" referenced in query'
+        in caplog.text
+    )
+
+
+def test_update_with_deprecated_field(db, caplog):
+    """
+    Ensure that updates referencing a deprecated field are logged.
+    """
+
+    caplog.set_level(logging.ERROR)
+
+    Album.objects.update(title=None)
+    assert 'Writing to deprecated field "title" on "tests.models.Album"' in caplog.text
+
+
+def test_filter_with_deprecated_field(db, caplog):
+    """
+    Ensure that filtering on a deprecated field compares against NULL.
+    """
+
+    Genre.objects.create()
+    caplog.set_level(logging.ERROR)
+
+    assert not Genre.objects.filter(name="test").exists()
+    assert Genre.objects.filter(name__isnull=True).count() == 1
@@ -0,0 +1,128 @@
+import logging
+import random
+
+import pytest
+from django.core.signals import request_finished
+from django.test import override_settings
+
+from deprecated_field import DeprecatedFieldAccessError
+from deprecated_field.utils import _reset_local_state, flush_logs, log_or_raise
+
+from ..models import Album, Genre
+
+
+@pytest.fixture(autouse=True)
+def reset_local_state():
+    """
+    Batching and sampling keep per thread state, make sure it does not leak
+    between tests.
+    """
+
+    _reset_local_state()
+    yield
+    _reset_local_state()
+
+
+def test_batch_logs(db, caplog):
+
+    caplog.set_level(logging.ERROR)
+
+    with override_settings(DEPRECATED_FIELD_BATCH_LOGS=True):
+        for _ in range(3):
+            Genre(name="test")
+
+        assert not caplog.records
+
+        flush_logs()
+
+    assert len(caplog.records) == 1
+    assert caplog.records[0].count == 3
+    assert (
+        'Tried to set deprecated field "name" on instance of "tests.models.Genre" '
+        "(3 times)" in caplog.text
+    )
+
+
+def test_batch_logs_request_finished(db, caplog):
+
+    caplog.set_level(logging.ERROR)
+
+    with override_settings(DEPRECATED_FIELD_BATCH_LOGS=True):
+        Genre(name="test")
+        assert not caplog.records
+
+        request_finished.send(sender=None)
+
+    assert len(caplog.records) == 1
+    assert caplog.records[0].count == 1
+
+
+def test_sample_logs(db, caplog, monkeypatch):
+
+    caplog.set_level(logging.ERROR)
+
+    # Never sample anything after the first occurrence of each error
+    monkeypatch.setattr(random, "random", lambda: 0.99)
+
+    with override_settings(DEPRECATED_FIELD_SAMPLE_RATE=0.5):
+        for _ in range(4):
+            Genre(name="test")
+            Album(title="test")
+
+    assert len(caplog.records) == 2
+    assert (
+        'Tried to set deprecated field "name" on instance of "tests.models.Genre"'
+        in caplog.text
+    )
+    assert (
+        'Tried to set deprecated field "title" on instance of "tests.models.Album"'
+        in caplog.text
+    )
+
+
+def test_sample_logs_sampled(db, caplog, monkeypatch):
+
+    caplog.set_level(logging.ERROR)
+
+    # Sample every error after the first occurrence
+    monkeypatch.setattr(random, "random", lambda: 0.01)
+
+    with override_settings(DEPRECATED_FIELD_SAMPLE_RATE=0.5):
+        for _ in range(4):
+            Genre(name="test")
+
+    assert len(caplog.records) == 4
+
+
+def test_sample_logs_disabled(db, caplog):
+
+    caplog.set_level(logging.ERROR)
+
+    with override_settings(DEPRECATED_FIELD_SAMPLE_RATE=0):
+        Genre(name="test")
+
+    assert not caplog.records
+
+
+def test_sample_logs_invalid_rate(db, caplog):
+
+    caplog.set_level(logging.WARNING)
+
+    with override_settings(DEPRECATED_FIELD_SAMPLE_RATE="often"):
+        for _ in range(2):
+            Genre(name="test")
+
+    assert "Invalid DEPRECATED_FIELD_SAMPLE_RATE 'often'" in caplog.text
+    assert len([r for r in caplog.records if r.levelno == logging.ERROR]) == 2
+
+
+def test_log_or_raise_with_args(caplog):
+
+    caplog.set_level(logging.ERROR)
+
+    log_or_raise('Accessed deprecated field "%s"', "name")
+    assert 'Accessed deprecated field "name"' in caplog.text
+
+    with pytest.raises(DeprecatedFieldAccessError, match='field "name"'):
+        with override_settings(STRICT_DEPRECATED_FIELD=True):
+            log_or_raise('Accessed deprecated field "%s"', "name")